@@ -12,3 +12,19 @@ if sys.version_info < (3, 12):
     from typing_extensions import TypedDict
 else:
     from typing import TypedDict
+
+if sys.version_info < (3, 11):
+    import toml as _toml
+
+    def load_toml(path) -> dict:
+        """Parse a TOML file."""
+        return _toml.load(path)
+
+else:
+    # AVAILABLE IN PYTHON 3.11
+    import tomllib
+
+    def load_toml(path) -> dict:
+        """Parse a TOML file."""
+        with open(path, "rb") as f:
+            return tomllib.load(f)
@@ -1,12 +1,22 @@
 from __future__ import annotations
 
-from typing import Literal
+from typing import Literal, Optional
 import datetime as dt
 import functools as ft
 import logging
+import threading
 
 import httpx
 
+try:
+    # h2 is an optional httpx extra (httpx[http2]), multiplexing many in-flight API
+    # calls over a single TCP connection when the ThoughtSpot gateway supports it.
+    import h2  # noqa: F401
+
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
 from cs_tools import __version__
 from cs_tools.api import _utils
 from cs_tools.api._rest_api_v1 import RESTAPIv1
@@ -15,6 +25,12 @@ from cs_tools.api._rest_api_v2 import RESTAPIv2
 log = logging.getLogger(__name__)
 _CALLOSUM_DEFAULT_TIMEOUT_SECONDS = 60 * 5
 
+# ThoughtSpot's API gateway doesn't benefit from more than a handful of concurrent
+# connections per-client, and keeping a few warm sockets around avoids paying the
+# TCP+TLS handshake on every call.
+_DEFAULT_CONNECTION_LIMITS = httpx.Limits(max_connections=10, max_keepalive_connections=5, keepalive_expiry=60)
+_ETAG_CACHE_MAX_ENTRIES = 128
+
 
 class RESTAPIClient:
     """
@@ -34,15 +50,27 @@ class RESTAPIClient:
         # Metadata about requests coming from this client
         client_opts["headers"]["user-agent"] = f"cs_tools/{__version__} (+github: thoughtspot/cs_tools)"
 
-        if "event_hooks" not in client_opts:
-            client_opts["event_hooks"] = {"request": [], "response": []}
-
-        client_opts["event_hooks"]["request"].append(self.__before_request__)
-        client_opts["event_hooks"]["response"].append(self.__after_response__)
+        if "transport" not in client_opts:
+            # Mount a single transport so every request shares one connection pool, and
+            # transparently retry connect-errors (flaky VPNs, sleepy load balancers).
+            client_opts["transport"] = httpx.HTTPTransport(
+                limits=client_opts.pop("limits", _DEFAULT_CONNECTION_LIMITS),
+                retries=3,
+                http2=_HTTP2_AVAILABLE,
+                verify=client_opts.pop("verify", True),
+                proxy=client_opts.pop("proxy", None),
+            )
 
         self._session = httpx.Client(base_url=ts_url, timeout=timeout, **client_opts)
-        self._v1_endpoints = RESTAPIv1(api_client=self)
-        self._v2_endpoints = RESTAPIv2(api_client=self)
+        self._last_traffic_at: Optional[dt.datetime] = None
+        self._etag_cache: dict[str, tuple[str, httpx.Response]] = {}
+        self._etag_cache_lock = threading.Lock()
+
+        # ThoughtSpot REST API V1 and V2 handling. Plain attributes (instead of
+        # properties) since every middleware call goes through these lookups.
+        self.v1 = RESTAPIv1(api_client=self)
+        self.v2 = RESTAPIv2(api_client=self)
+
         self._setup_session_class_proxying()
 
     def _setup_session_class_proxying(self) -> None:
@@ -57,12 +85,18 @@ class RESTAPIClient:
         Called after a request is fully prepared, but before it is sent to the network.
 
         Passed the request instance.
-
-        Further reading:
-            https://www.python-httpx.org/advanced/#event-hooks
         """
         now = dt.datetime.now(tz=dt.timezone.utc)
-        request.headers["cs-tools-request-start-utc-timestamp"] = now.isoformat()
+
+        # Stash timing metadata on the request extensions instead of the headers; a
+        # header write re-encodes the header block and ships the timestamp to the
+        # server for no reason.
+        request.extensions["cs_tools_request_start_utc_timestamp"] = now
+
+        # Formatting the request (decoding + re-parsing the body) is expensive, don't
+        # pay for it unless the message would actually be emitted.
+        if not log.isEnabledFor(logging.DEBUG):
+            return
 
         log_msg = (
             f">>> [{now:%H:%M:%S}] HTTP {request.method} -> {request.url.path}"
@@ -85,24 +119,53 @@ class RESTAPIClient:
         # DEV NOTE: @boonhapus, 2024/02/15
         # If we want to make the CS Tools HTTP client asyncio-friendly, all we need to do is swap the this/before/after
         # request methods for async counterparts.
-        return self._session.request(method, url, **kwargs)
+        #
+        # Build + send directly (instead of registering event hooks) so there is a
+        # single dispatch point and httpx doesn't iterate hook lists on every request.
+        request = self._session.build_request(method, url, **kwargs)
+
+        # Revalidate instead of refetch. When ThoughtSpot tagged an earlier identical
+        # GET with an ETag, offer it back -- a 304 lets us skip the response body
+        # (metadata listings run to megabytes) and serve the cached one.
+        cached = self._etag_cache.get(str(request.url)) if method == "GET" else None
+
+        if cached is not None:
+            request.headers["if-none-match"] = cached[0]
+
+        self.__before_request__(request)
+
+        response = self._session.send(request)
+        self.__after_response__(response)
+
+        if cached is not None and response.status_code == httpx.codes.NOT_MODIFIED:
+            return cached[1]
+
+        if method == "GET" and (etag := response.headers.get("etag")) is not None and response.is_success:
+            # middlewares call .request() from thread pools, so the size-check, evict,
+            # and insert must happen as one unit or two threads at the cap can race on
+            # the same victim (KeyError) or mutate the dict mid-iteration (RuntimeError)
+            with self._etag_cache_lock:
+                if len(self._etag_cache) >= _ETAG_CACHE_MAX_ENTRIES:
+                    self._etag_cache.pop(next(iter(self._etag_cache)), None)
+
+                self._etag_cache[str(request.url)] = (etag, response)
+
+        return response
 
     def __after_response__(self, response: httpx.Response) -> None:
         """
         Called after the response has been fetched from the network, but before it is returned to the caller.
 
         Passed the response instance.
-
-        Response event hooks are called before determining if the response body should be read or not.
-
-        Further reading:
-            https://www.python-httpx.org/advanced/#event-hooks
         """
         now = dt.datetime.now(tz=dt.timezone.utc)
-        response.headers["cs-tools-response-receive-utc-timestamp"] = now.isoformat()
+        self._last_traffic_at = now
 
-        if utc_requested_at := response.request.headers.get("cs-tools-request-start-utc-timestamp", None):
-            elapsed = f"({(now - dt.datetime.fromisoformat(utc_requested_at)).total_seconds()}s)"
+        if not log.isEnabledFor(logging.DEBUG):
+            return
+
+        if utc_requested_at := response.request.extensions.get("cs_tools_request_start_utc_timestamp", None):
+            elapsed = f"({(now - utc_requested_at).total_seconds()}s)"
         else:
             elapsed = ""
 
@@ -115,11 +178,7 @@ class RESTAPIClient:
         log.debug(log_msg)
 
     @property
-    def v1(self) -> RESTAPIv1:
-        """ThoughtSpot REST API V1 Handling."""
-        return self._v1_endpoints
+    def last_traffic_at(self) -> Optional[dt.datetime]:
+        """When the last response was received from ThoughtSpot, if any."""
+        return self._last_traffic_at
 
-    @property
-    def v2(self) -> RESTAPIv2:
-        """ThoughtSpot REST API V2 Handling."""
-        return self._v2_endpoints
@@ -39,6 +39,10 @@ if TYPE_CHECKING:
 
 log = logging.getLogger(__name__)
 
+# Static payloads for endpoints we call repeatedly; built once instead of per-call.
+_ALL_ORGS_PARAMS = {"batchsize": -1, "offset": -1}
+_SEARCH_DATA_OPTIONS = {"include_column_details": True}
+
 
 class RESTAPIv1:
     """
@@ -50,6 +54,7 @@ class RESTAPIv1:
     def __init__(self, api_client: RESTAPIClient):
         self._api_client = api_client
         self._redirected_url_due_to_tsload_load_balancer: Optional[httpx.URL] = None
+        self._default_dataservice_url: Optional[httpx.URL] = None
 
     def request(self, method: str, endpoint: str, **request_kw) -> httpx.Response:
         """Pre-process the request to remove undefined parameters."""
@@ -87,8 +92,7 @@ class RESTAPIv1:
         return r
 
     def session_orgs_read(self) -> httpx.Response:
-        p = {"batchsize": -1, "offset": -1}
-        r = self.request("GET", "callosum/v1/tspublic/v1/session/orgs", params=p)
+        r = self.request("GET", "callosum/v1/tspublic/v1/session/orgs", params=_ALL_ORGS_PARAMS)
         return r
 
     def session_orgs_update(self, *, org_id: int) -> httpx.Response:
@@ -285,10 +289,7 @@ class RESTAPIv1:
             "offset": offset,
             "formattype": format_type,
         }
-        d = {
-            "include_column_details": True,
-        }
-        r = self.request("POST", "callosum/v1/tspublic/v1/searchdata", params=p, data=d)
+        r = self.request("POST", "callosum/v1/tspublic/v1/searchdata", params=p, data=_SEARCH_DATA_OPTIONS)
         return r
 
     # ==================================================================================================================
@@ -590,11 +591,13 @@ class RESTAPIv1:
     def dataservice_url(self) -> httpx.URL:
         """Override the URL if the ThoughtSpot serving node redirects us to another."""
         if self._redirected_url_due_to_tsload_load_balancer is not None:
-            url = self._redirected_url_due_to_tsload_load_balancer
-        else:
-            url = self._api_client._session.base_url.copy_with(port=8442)
+            return self._redirected_url_due_to_tsload_load_balancer
+
+        # the base_url never changes within a session, so only derive the URL once
+        if self._default_dataservice_url is None:
+            self._default_dataservice_url = self._api_client._session.base_url.copy_with(port=8442)
 
-        return url
+        return self._default_dataservice_url
 
     def dataservice_tokens_static(self) -> httpx.Response:
         r = self.request("GET", "ts_dataservice/v1/public/tql/tokens/static")
@@ -65,8 +65,13 @@ class RESTAPIv2:
         utc_start: dt.datetime,
         utc_end: dt.datetime,
     ) -> httpx.Response:
-        assert utc_start.tzinfo == dt.timezone.utc, f"'utc_start' must be a datetime in UTC, got {utc_start.tzinfo=}"
-        assert utc_end.tzinfo == dt.timezone.utc, f"'utc_end' must be a datetime in UTC, got {utc_end.tzinfo=}"
+        # explicit raises instead of asserts, so the guard survives `python -O`
+        if utc_start.tzinfo != dt.timezone.utc:
+            raise ValueError(f"'utc_start' must be a datetime in UTC, got {utc_start.tzinfo=}")
+
+        if utc_end.tzinfo != dt.timezone.utc:
+            raise ValueError(f"'utc_end' must be a datetime in UTC, got {utc_end.tzinfo=}")
+
         body = {
             "log_type": log_type,
             "start_epoch_time_in_millis": int(utc_start.timestamp() * 1000),
@@ -15,6 +15,20 @@ import uuid
 
 import httpx
 
+try:
+    # optional, but >5x faster at encoding the large guid lists we send to the
+    # metadata endpoints
+    import orjson
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+    _json_loads = orjson.loads
+
+except ImportError:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
 UndefinedType = enum.Enum("_UndefinedTyped", "SENTINEL")
 UNDEFINED = UndefinedType.SENTINEL
 SYSTEM_USERS = {"system": "System User", "su": "Administrator Super-User", "tsadmin": "Administrator"}
@@ -43,13 +57,33 @@ def scrub_undefined_sentinel(inp: Any, *, null: Union[UndefinedType, None]) -> A
     httpx uses None as a meaningful value in some cases. We use the UNDEFINED object as
     a marker for a default value.
     """
-    if isinstance(inp, dict):
-        return {k: scrub_undefined_sentinel(v, null=null) for k, v in inp.items() if v is not null}
+    if not isinstance(inp, (dict, list)):
+        return inp
+
+    # Iterative traversal; request bodies can nest arbitrarily (eg. TML import, share
+    # permissions) and we call this on every API request, so don't pay for recursion.
+    root: Union[dict, list] = {} if isinstance(inp, dict) else []
+    stack: list[tuple[Union[dict, list], Union[dict, list]]] = [(inp, root)]
+
+    while stack:
+        src, dst = stack.pop()
+        items = src.items() if isinstance(src, dict) else enumerate(src)
 
-    if isinstance(inp, list):
-        return [scrub_undefined_sentinel(v, null=null) for v in inp if v is not null]
+        for key, value in items:
+            if value is null:
+                continue
 
-    return inp
+            if isinstance(value, (dict, list)):
+                child: Union[dict, list] = {} if isinstance(value, dict) else []
+                stack.append((value, child))
+                value = child
+
+            if isinstance(dst, dict):
+                dst[key] = value
+            else:
+                dst.append(value)
+
+    return root
 
 
 def obfuscate_sensitive_data(request_query: httpx.QueryParams) -> dict[str, Any]:
@@ -82,4 +116,14 @@ def dumps(inp: Union[list[Any], type[UNDEFINED]]) -> Union[str, type[UNDEFINED]]
     if inp is UNDEFINED:
         return inp
 
-    return json.dumps(inp)
+    return _json_dumps(inp)
+
+
+def loads(response: httpx.Response) -> Any:
+    """
+    httpx.Response.json, but through the fastest decoder available.
+
+    httpx decodes with the stdlib json module; metadata listings run to megabytes,
+    where orjson is 2-5x faster.
+    """
+    return _json_loads(response.content)
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING, Optional, Union
+import concurrent.futures as cf
+import functools as ft
+import itertools as it
 import logging
 
 from cs_tools.api import _utils
@@ -12,6 +15,11 @@ if TYPE_CHECKING:
 
 log = logging.getLogger(__name__)
 
+# How many speculative page requests to keep in flight. Pages are fixed-size, so
+# their offsets are known up front; a short wave bounds the wasted work once
+# isLastBatch shows up.
+_MAX_CONCURRENT_PAGES = 4
+
 
 class AnswerMiddleware:
     """ """
@@ -49,49 +57,64 @@ class AnswerMiddleware:
         answers : list[Dict[str, Any]]
           all answer headers
         """
-        if isinstance(tags, str):
-            tags = [tags]
-
-        if tags is None:
-            tags = []
+        # normalize in a single step: None -> [], str -> [str]
+        tags = [tags] if isinstance(tags, str) else (tags or [])
 
         answers = []
-
-        while True:
-            r = self.ts.api.v1.metadata_list(
-                metadata_type="QUESTION_ANSWER_BOOK",
-                category=category,
-                tag_names=tags or _utils.UNDEFINED,
-                show_hidden=hidden,
-                auto_created=auto_created,
-                batchsize=chunksize,
-                offset=len(answers),
-            )
-
-            data = r.json()
-            to_extend = data["headers"]
-
-            if exclude_system_content:
-                to_extend = [answer for answer in to_extend if answer.get("authorName") not in _utils.SYSTEM_USERS]
-
-            answers.extend([{"metadata_type": "QUESTION_ANSWER_BOOK", **answer} for answer in to_extend])
-
-            if not answers and raise_on_error:
-                info = {
-                    "incl": "exclude" if exclude_system_content else "include",
-                    "category": category,
-                    "tags": ", ".join(tags),
-                    "reason": (
-                        "Zero {type} matched the following filters"
-                        "\n"
-                        "\n  - [blue]{category.value}[/] {type}"
-                        "\n  - [blue]{incl}[/] admin-generated {type}"
-                        "\n  - with tags [blue]{tags}"
-                    ),
-                }
-                raise ContentDoesNotExist(type="answers", **info)
-
-            if data["isLastBatch"]:
-                break
+        offset = 0
+        is_last_batch = False
+
+        # bind the excluded names once -- the membership test runs per row
+        system_users = frozenset(_utils.SYSTEM_USERS) if exclude_system_content else frozenset()
+
+        fetch = ft.partial(
+            self.ts.api.v1.metadata_list,
+            metadata_type="QUESTION_ANSWER_BOOK",
+            category=category,
+            tag_names=tags or _utils.UNDEFINED,
+            show_hidden=hidden,
+            auto_created=auto_created,
+            batchsize=chunksize,
+        )
+
+        with cf.ThreadPoolExecutor(max_workers=_MAX_CONCURRENT_PAGES) as pool:
+            while not is_last_batch:
+                # fetch the lead page of each wave synchronously, and only speculate on
+                # further pages once it confirms there are more -- a tenant that fits in
+                # one page issues exactly one request, same as sequential pagination
+                lead = fetch(offset=offset).json()
+                futures = []
+
+                if not lead["isLastBatch"]:
+                    next_offset = offset + len(lead["headers"])
+                    futures = [
+                        pool.submit(fetch, offset=next_offset + i * chunksize)
+                        for i in range(_MAX_CONCURRENT_PAGES - 1)
+                    ]
+
+                for data in it.chain([lead], (future.result().json() for future in futures)):
+                    offset += len(data["headers"])
+
+                    # single filter+annotate pass per page, no intermediate lists
+                    answers.extend(
+                        {"metadata_type": "QUESTION_ANSWER_BOOK", **answer}
+                        for answer in data["headers"]
+                        if answer.get("authorName") not in system_users
+                    )
+
+                    if data["isLastBatch"]:
+                        is_last_batch = True
+                        break
+
+                if not answers and raise_on_error:
+                    incl = "exclude" if exclude_system_content else "include"
+                    reason = (
+                        f"Zero answers matched the following filters"
+                        f"\n"
+                        f"\n  - [blue]{category.value}[/] answers"
+                        f"\n  - [blue]{incl}[/] admin-generated answers"
+                        f"\n  - with tags [blue]{', '.join(tags)}"
+                    )
+                    raise ContentDoesNotExist(type="answers", reason=reason)
 
         return answers
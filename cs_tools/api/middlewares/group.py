@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
+import functools as ft
 import logging
 
 import httpx
@@ -40,9 +41,13 @@ class GroupMiddleware:
 
         return groups
 
+    @ft.cache
     def guid_for(self, group_name: str) -> GUID:
         """
         Return the GUID for a given Group.
+
+        name -> guid mappings don't change within a CLI invocation, so repeated
+        lookups are served from cache instead of re-hitting group/read.
         """
         if _utils.is_valid_guid(group_name):
             return group_name
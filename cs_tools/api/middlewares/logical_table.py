@@ -50,14 +50,14 @@ class LogicalTableMiddleware:
         tables : list[Dict[str, Any]]
           all answer headers
         """
-        if isinstance(tags, str):
-            tags = [tags]
-
-        if tags is None:
-            tags = []
+        # normalize in a single step: None -> [], str -> [str]
+        tags = [tags] if isinstance(tags, str) else (tags or [])
 
         tables = []
 
+        # bind the excluded names once -- the membership test runs per row
+        system_users = frozenset(_utils.SYSTEM_USERS) if exclude_system_content else frozenset()
+
         while True:
             r = self.ts.api.v1.metadata_list(
                 metadata_type="LOGICAL_TABLE",
@@ -69,18 +69,18 @@ class LogicalTableMiddleware:
             )
 
             data = r.json()
-            to_extend = data["headers"]
-
-            if exclude_system_content:
-                to_extend = [table for table in to_extend if table.get("authorName") not in _utils.SYSTEM_USERS]
 
-            # Fake the .type for Models.
-            to_extend = [
-                {**table, "type": "MODEL" if table.get("worksheetVersion") == "V2" else table["type"]}
-                for table in to_extend
-            ]
-
-            tables.extend([{"metadata_type": "LOGICAL_TABLE", **table} for table in to_extend])
+            # single filter+annotate pass per page, no intermediate lists
+            # (.type is faked as MODEL for V2 worksheets)
+            tables.extend(
+                {
+                    "metadata_type": "LOGICAL_TABLE",
+                    **table,
+                    "type": "MODEL" if table.get("worksheetVersion") == "V2" else table["type"],
+                }
+                for table in data["headers"]
+                if table.get("authorName") not in system_users
+            )
 
             if not tables and raise_on_error:
                 info = {
@@ -101,6 +101,16 @@ class LogicalTableMiddleware:
                 break
 
         if include_data_source:
+            # warm the details cache in bulk -- chunked calls instead of one per table,
+            # then one more for the set of distinct connections
+            table_guids = [table["id"] for table in tables]
+            self.ts.metadata.fetch_header_and_extras(metadata_type="LOGICAL_TABLE", guids=table_guids)
+
+            connection_guids = dict.fromkeys(
+                self.ts.metadata.find_data_source_of_logical_table(guid=guid) for guid in table_guids
+            )
+            self.ts.metadata.fetch_header_and_extras(metadata_type="DATA_SOURCE", guids=list(connection_guids))
+
             for table in tables:
                 connection_guid = self.ts.metadata.find_data_source_of_logical_table(guid=table["id"])
                 info = self.ts.metadata.fetch_header_and_extras(metadata_type="DATA_SOURCE", guids=[connection_guid])  # type: ignore
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Iterator, Optional
+import concurrent.futures as cf
 import functools as ft
 import logging
+import sys
 
 from cs_tools import utils
 from cs_tools.api import _utils
@@ -21,6 +23,10 @@ if TYPE_CHECKING:
 
 log = logging.getLogger(__name__)
 
+# How many chunked API calls may be in flight at once. The client's connection pool
+# caps actual sockets, this just bounds how much work we queue against it.
+_MAX_CONCURRENT_CHUNKS = 4
+
 
 class MetadataMiddleware:
     """ """
@@ -41,13 +47,28 @@ class MetadataMiddleware:
         """
         Fetch permissions for a given object type.
         """
+        # normalize in a single step -- a bare guid would otherwise be iterated
+        # character-by-character during dedupe below
+        guids = [guids] if isinstance(guids, str) else guids
+
+        # No guids, no API calls -- callers loop over metadata types and some types
+        # simply have no content.
+        if not guids:
+            return []
+
         sharing_access = []
-        group_guids = [group["id"] for group in self.ts.group.all()]
+        group_guids = {group["id"] for group in self.ts.group.all()}
+
+        # callers often concatenate guid lists from multiple sources; don't pay for
+        # fetching the same object's permissions twice
+        chunks = list(utils.batched(dict.fromkeys(guids), n=chunksize))
 
-        for chunk in utils.batched(guids, n=chunksize):
-            r = self.ts.api.v1.security_metadata_permissions(metadata_type=metadata_type, guids=chunk)
+        with cf.ThreadPoolExecutor(max_workers=min(_MAX_CONCURRENT_CHUNKS, len(chunks))) as pool:
+            fetch = ft.partial(self.ts.api.v1.security_metadata_permissions, metadata_type=metadata_type)
+            responses = list(pool.map(lambda chunk: fetch(guids=chunk), chunks))
 
-            for data in r.json().values():
+        for r in responses:
+            for data in _utils.loads(r).values():
                 for shared_to_principal_guid, permission in data["permissions"].items():
                     d = {
                         "object_guid": permission["topLevelObjectId"],
@@ -67,7 +88,7 @@ class MetadataMiddleware:
         return sharing_access
 
     def dependents(
-            self, guids: list[GUID], *, for_columns: bool = False, include_columns: bool = False, chunksize: int = 50
+            self, guids: list[GUID], *, for_columns: bool = False, include_columns: bool = False, chunksize: int = 500
     ) -> TableRowsFormat:
         """
         Get all dependencies of content in ThoughtSpot.
@@ -91,6 +112,10 @@ class MetadataMiddleware:
         dependencies : TableRowsFormat
           all dependencies' headers
         """
+        # normalize in a single step -- a bare guid would otherwise be iterated
+        # character-by-character during dedupe below
+        guids = [guids] if isinstance(guids, str) else guids
+
         if include_columns:
             guids = [column["header"]["id"] for column in self.ts.logical_table.columns(guids)]
             type_ = "LOGICAL_COLUMN"
@@ -99,16 +124,34 @@ class MetadataMiddleware:
         else:
             type_ = "LOGICAL_TABLE"
 
-        dependents = []
-
-        for chunk in utils.batched(guids, n=chunksize):
-            r = self.ts.api.v1.dependency_list_dependents(guids=chunk, metadata_type=type_)
-            data = r.json()
+        if not guids:
+            return []
 
-            for parent_guid, all_dependencies in data.items():
-                for dependency_type, headers in all_dependencies.items():
-                    for header in headers:
-                        dependents.append({"parent_guid": parent_guid, "metadata_type": dependency_type, **header})
+        dependents = []
+        chunks = list(utils.batched(dict.fromkeys(guids), n=chunksize))
+
+        with cf.ThreadPoolExecutor(max_workers=min(_MAX_CONCURRENT_CHUNKS, len(chunks))) as pool:
+            fetch = ft.partial(self.ts.api.v1.dependency_list_dependents, metadata_type=type_)
+            futures = {pool.submit(fetch, guids=chunk): chunk for chunk in chunks}
+
+        # all futures are complete once the pool context exits; harvest errors
+        # per-chunk so one bad batch doesn't throw away everyone else's results
+        responses = []
+
+        for future, chunk in futures.items():
+            try:
+                responses.append(future.result())
+            except Exception as e:
+                log.warning(f"Failed to fetch dependents for {len(chunk)} guids, see logs for details..")
+                log.debug(f"guids: {chunk}\n{e}", exc_info=True)
+
+        for r in responses:
+            dependents.extend(
+                {"parent_guid": parent_guid, "metadata_type": dependency_type, **header}
+                for parent_guid, all_dependencies in _utils.loads(r).items()
+                for dependency_type, headers in all_dependencies.items()
+                for header in headers
+            )
 
         return dependents
 
@@ -149,11 +192,13 @@ class MetadataMiddleware:
             exclude_types: Optional[list[str]] = None,
             exclude_subtypes: Optional[list[str]] = None,
             exclude_system_content: bool = True,
-    ) -> TableRowsFormat:
+    ) -> Iterator[dict]:
         """
         Find all object which meet the predicates in the keyword args.
+
+        Headers are yielded as each page comes back from the API, so callers start
+        working on results before the full catalog has been listed.
         """
-        content = []
         metadata_list_kw = {}
 
         if tags is not None:
@@ -165,6 +210,9 @@ class MetadataMiddleware:
         if pattern is not None:
             metadata_list_kw["pattern"] = pattern
 
+        # bind the excluded names once -- the membership test runs per row
+        system_users = frozenset(_utils.SYSTEM_USERS) if exclude_system_content else frozenset()
+
         for metadata_type in MetadataObjectType:
             # can't exclude logical tables because they have sub-types.  Logical tables will be checked on subtype.
             if (
@@ -187,13 +235,13 @@ class MetadataMiddleware:
                     log.error(f"The following metadata/list parameters caused an error\n{metadata_list_kw}")
                     break
 
-                data = r.json()
+                data = _utils.loads(r)
                 metadata_list_kw["offset"] += len(data["headers"])
 
                 for header in data["headers"]:
                     subtype = header.get("type", None)
 
-                    if exclude_system_content and header.get("authorName") in _utils.SYSTEM_USERS:
+                    if header.get("authorName") in system_users:
                         continue
 
                     # All subtypes will be retrieved, so need to filter the subtype appropriately.
@@ -207,13 +255,11 @@ class MetadataMiddleware:
 
                     header["metadata_type"] = metadata_type
                     header["type"] = subtype
-                    content.append(header)
+                    yield header
 
                 if data["isLastBatch"]:
                     break
 
-        return content
-
     def objects_exist(self, metadata_type: MetadataObjectType, guids: list[GUID]) -> dict[GUID, bool]:
         """
         Check if the input GUIDs exist.
@@ -224,55 +270,47 @@ class MetadataMiddleware:
         existence = {header["id"] for header in r.json()["headers"]}
         return {guid: guid in existence for guid in guids}
 
-    def fetch_header_and_extras(self, metadata_type: MetadataObjectType, guids: list[GUID]) -> list[dict]:
+    def fetch_header_and_extras(
+        self, metadata_type: MetadataObjectType, guids: list[GUID], *, chunksize: int = 25
+    ) -> list[dict]:
         """
         METADATA DETAILS is expensive. Here's our shortcut.
         """
-        data = []
-
-        for guid in guids:
-            if guid in self._error_cache:
-                continue
-
-            if guid in self._details_cache:
-                data.append(self._details_cache[guid])
-                continue
-
-            r = self.ts.api.v1.metadata_details(metadata_type=metadata_type, guids=[guid], show_hidden=True)
-
-            if r.is_error:
-                self._error_cache.add(guid)
-                log.warning(f"Failed to fetch details for {guid} ({metadata_type})")
-                continue
-
-            j = r.json()
-
-            if not j["storables"]:
-                self._error_cache.add(guid)
-                log.warning(f"Failed to fetch details for {guid} ({metadata_type})")
-                continue
-
-            d = j["storables"][0]
-
-            # fmt: off
-            header_and_extras = {
-                "metadata_type": metadata_type,
-                "header": d["header"],
-                "type": d.get("type"),  # READ: .subtype  (eg. ONE_TO_ONE_LOGICAL, WORKSHEET, etc..)
-
-                # LOGICAL_TABLE extras
-                "dataSourceId": d.get("dataSourceId"),
-                "columns": d.get("columns"),
-
-                # VIZ extras (answer, liveboard)
-                "reportContent": d.get("reportContent"),
-            }
-            # fmt: on
-
-            self._details_cache[guid] = header_and_extras
-            data.append(header_and_extras)
-
-        return data
+        # intern the guids -- they are reused as dict keys (details/error caches) many
+        # times over, and interned strings compare by pointer instead of by character
+        guids = [sys.intern(g) for g in guids]
+        unseen = [g for g in dict.fromkeys(guids) if g not in self._details_cache and g not in self._error_cache]
+
+        # metadata/details accepts many ids at once -- one call per chunk of unseen
+        # guids instead of one call per guid.
+        for chunk in utils.batched(unseen, n=chunksize):
+            r = self.ts.api.v1.metadata_details(metadata_type=metadata_type, guids=list(chunk), show_hidden=True)
+            storables = [] if r.is_error else _utils.loads(r)["storables"]
+
+            for d in storables:
+                # fmt: off
+                header_and_extras = {
+                    "metadata_type": metadata_type,
+                    "header": d["header"],
+                    "type": d.get("type"),  # READ: .subtype  (eg. ONE_TO_ONE_LOGICAL, WORKSHEET, etc..)
+
+                    # LOGICAL_TABLE extras
+                    "dataSourceId": d.get("dataSourceId"),
+                    "columns": d.get("columns"),
+
+                    # VIZ extras (answer, liveboard)
+                    "reportContent": d.get("reportContent"),
+                }
+                # fmt: on
+
+                self._details_cache[sys.intern(d["header"]["id"])] = header_and_extras
+
+            for guid in chunk:
+                if guid not in self._details_cache:
+                    self._error_cache.add(guid)
+                    log.warning(f"Failed to fetch details for {guid} ({metadata_type})")
+
+        return [self._details_cache[guid] for guid in guids if guid in self._details_cache]
 
     @ft.cache
     def find_data_source_of_logical_table(self, guid: GUID) -> GUID:
@@ -47,14 +47,14 @@ class PinboardMiddleware:
         pinboards : api._types.RECORDS
           all pinboard headers
         """
-        if isinstance(tags, str):
-            tags = [tags]
-
-        if tags is None:
-            tags = []
+        # normalize in a single step: None -> [], str -> [str]
+        tags = [tags] if isinstance(tags, str) else (tags or [])
 
         pinboards = []
 
+        # bind the excluded names once -- the membership test runs per row
+        system_users = frozenset(_utils.SYSTEM_USERS) if exclude_system_content else frozenset()
+
         while True:
             r = self.ts.api.v1.metadata_list(
                 metadata_type="PINBOARD_ANSWER_BOOK",
@@ -65,14 +65,13 @@ class PinboardMiddleware:
             )
 
             data = r.json()
-            to_extend = data["headers"]
 
-            if exclude_system_content:
-                to_extend = [
-                    pinboard for pinboard in to_extend if pinboard.get("authorName") not in _utils.SYSTEM_USERS
-                ]
-
-            pinboards.extend([{"metadata_type": "PINBOARD_ANSWER_BOOK", **pinboard} for pinboard in to_extend])
+            # single filter+annotate pass per page, no intermediate lists
+            pinboards.extend(
+                {"metadata_type": "PINBOARD_ANSWER_BOOK", **pinboard}
+                for pinboard in data["headers"]
+                if pinboard.get("authorName") not in system_users
+            )
 
             if not pinboards and raise_on_error:
                 info = {
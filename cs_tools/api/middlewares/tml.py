@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Sequence, Union
 import logging
 
 from thoughtspot_tml.utils import determine_tml_type
 import httpx
 
+from cs_tools import utils
 from cs_tools.types import GUID, TMLAPIResponse, TMLImportPolicy, TMLSupportedContent
 
 if TYPE_CHECKING:
@@ -26,30 +27,44 @@ class TMLMiddleware:
 
     # @validate_arguments
     def to_import(
-        self, tmls: list[Union[TML, str]], *, policy: TMLImportPolicy = TMLImportPolicy.all_or_none, force: bool = False
+        self,
+        tmls: list[Union[TML, str]],
+        *,
+        policy: TMLImportPolicy = TMLImportPolicy.all_or_none,
+        force: bool = False,
+        chunksize: int = 50,
     ) -> list[TMLAPIResponse]:
         """
         Import TML objects.
         """
-        r = self.ts.api.v1.metadata_tml_import(
-            import_objects=[t.dumps() if not isinstance(t, str) else t for t in tmls],
-            import_policy=policy,
-            force_create=force,
-        )
+        # ALL_OR_NONE is atomic across the whole import, so it can't be split.. but the
+        # other policies are per-object and a single giant payload both balloons memory
+        # on the server and forfeits any feedback until the very last object imports.
+        if policy == TMLImportPolicy.all_or_none:
+            batches: list[Sequence[Union[TML, str]]] = [tmls]
+        else:
+            batches = list(utils.batched(tmls, n=chunksize))
 
         responses = []
 
-        for tml, content in zip(tmls, r.json()["object"]):
-            response = TMLAPIResponse(
-                guid=content["response"].get("header", {}).get("id_guid", None),
-                metadata_object_type=TMLSupportedContent.from_friendly_type(tml.tml_type_name).value,
-                tml_type_name=tml.tml_type_name,
-                name=content["response"].get("header", {}).get("name", tml.name),
-                status_code=content["response"]["status"]["status_code"],
-                error_messages=content["response"]["status"].get("error_message", None),
+        for batch in batches:
+            r = self.ts.api.v1.metadata_tml_import(
+                import_objects=[t.dumps() if not isinstance(t, str) else t for t in batch],
+                import_policy=policy,
+                force_create=force,
             )
-            response._full_response = content
-            responses.append(response)
+
+            for tml, content in zip(batch, r.json()["object"]):
+                response = TMLAPIResponse(
+                    guid=content["response"].get("header", {}).get("id_guid", None),
+                    metadata_object_type=TMLSupportedContent.from_friendly_type(tml.tml_type_name).value,
+                    tml_type_name=tml.tml_type_name,
+                    name=content["response"].get("header", {}).get("name", tml.name),
+                    status_code=content["response"]["status"]["status_code"],
+                    error_messages=content["response"]["status"].get("error_message", None),
+                )
+                response._full_response = content
+                responses.append(response)
 
         return responses
 
@@ -65,6 +65,7 @@ class TSLoadNodeRedirectCache:
 
     def _remove_old_data(self) -> None:
         DAYS_TO_KEEP = 10 * 86400
+        MAX_CYCLE_IDS_TO_KEEP = 200
         NOW = dt.datetime.now(tz=dt.timezone.utc).timestamp()
 
         keep = {}
@@ -81,6 +82,16 @@ class TSLoadNodeRedirectCache:
             if (NOW - init_ts) <= DAYS_TO_KEEP:
                 keep[cycle_id] = redirect_info
 
+        # clusters running many loads a day can outpace the time-based prune, so also
+        # bound the cache by entry count, evicting the least recently initialized
+        if len(keep) > MAX_CYCLE_IDS_TO_KEEP:
+            by_recency = sorted(
+                keep.items(),
+                key=lambda kv: kv[1].get("dataload_initialize") or kv[1].get("load_datetime"),
+                reverse=True,
+            )
+            keep = dict(by_recency[:MAX_CYCLE_IDS_TO_KEEP])
+
         self.dump(keep)
 
     def get_for(self, cycle_id: CycleID) -> Optional[CachedRedirectInfo]:
@@ -335,6 +346,8 @@ class TSLoadMiddleware:
         """
         self._check_privileges()
 
+        poll_delay = 1.0
+
         while True:
             r = self.ts.api.v1.dataservice_dataload_status(cycle_id=cycle_id)
             data = r.json()
@@ -343,6 +356,7 @@ class TSLoadMiddleware:
                 break
 
             if data["internal_stage"] in ("COMMITTING", "INGESTING"):
+                time.sleep(poll_delay)
                 continue
 
             if data["internal_stage"] == "DONE":
@@ -352,6 +366,9 @@ class TSLoadMiddleware:
                 break
 
             log.debug(f"data load status:\n{data}")
-            time.sleep(1)
+            time.sleep(poll_delay)
+
+            # back off gradually so long-running loads don't get hammered with status calls
+            poll_delay = min(poll_delay * 2, 30.0)
 
         return data
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
+import functools as ft
 import logging
 
 import httpx
@@ -38,9 +39,13 @@ class UserMiddleware:
 
         return users
 
+    @ft.cache
     def guid_for(self, username: str) -> GUID:
         """
         Return the GUID for a given User.
+
+        name -> guid mappings don't change within a CLI invocation, so repeated
+        lookups are served from cache instead of re-hitting user/read.
         """
         if _utils.is_valid_guid(username):
             return username
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import concurrent.futures as cf
 import datetime as dt
 import logging
+import os
 import pathlib
 import platform
 import shutil
@@ -21,6 +23,10 @@ import rich
 import typer
 
 log = logging.getLogger(__name__)
+
+# immutable for the life of the process; avoids an importlib lookup per use
+CS_TOOLS_PKG_DIR = utils.get_package_directory("cs_tools")
+
 app = typer.Typer(
     cls=CSToolsGroup,
     name="self",
@@ -181,15 +187,15 @@ def download(
     release_tag = release_info["tag_name"]
 
     if syncer_dialect is not None:
-        syncer_dir = utils.get_package_directory("cs_tools") / "sync" / syncer_dialect
+        syncer_dir = CS_TOOLS_PKG_DIR / "sync" / syncer_dialect
 
         if not syncer_dir.exists():
             log.error(f"Syncer dialect {syncer_dialect} not found")
             raise typer.Exit(1)
 
         log.info(f"Fetching {syncer_dialect} syncer dependencies")
-        manifest = base.SyncerManifest.model_validate_json(syncer_dir.joinpath("MANIFEST.json").read_text())
-        manifest.__ensure_pip_requirements__()
+        manifest = base.load_manifest(syncer_dir)
+        manifest.__ensure_pip_requirements__(__syncer_name__=syncer_dialect)
 
         with dir_to_zip.joinpath("requirements.txt").open(mode="a") as r:
             for requirement in manifest.requirements:
@@ -251,5 +257,11 @@ def download(
     log.info(f"Preparing your download at {zip_fp}")
     shutil.copy(_bootstrapper.__file__, dir_to_zip.joinpath("_bootstrapper.py"))
     shutil.copy(_updater.__file__, dir_to_zip.joinpath("_updater.py"))
-    shutil.make_archive(zip_fp.as_posix(), "zip", dir_to_zip)
-    shutil.rmtree(dir_to_zip)
+    utils.make_zip_archive(dir_to_zip, zip_fp.with_name(f"{zip_fp.name}.zip"))
+
+    # deleting hundreds of downloaded wheels is I/O bound and embarrassingly parallel;
+    # fan out the per-file deletes, then sweep up whatever skeleton remains
+    with cf.ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4)) as pool:
+        list(pool.map(lambda fp: fp.unlink(), (fp for fp in dir_to_zip.rglob("*") if fp.is_file())))
+
+    shutil.rmtree(dir_to_zip, ignore_errors=True)
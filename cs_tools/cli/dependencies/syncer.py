@@ -7,14 +7,17 @@ import pathlib
 import click
 import pydantic
 import sqlmodel
-import toml
 
 from cs_tools import errors, utils
+from cs_tools._compat import load_toml
 from cs_tools.cli.dependencies.base import Dependency
 from cs_tools.sync import base
 
 log = logging.getLogger(__name__)
 
+# immutable for the life of the process; avoids an importlib lookup per use
+CS_TOOLS_PKG_DIR = utils.get_package_directory("cs_tools")
+
 
 class DSyncer(Dependency):
     protocol: str
@@ -39,20 +42,24 @@ class DSyncer(Dependency):
             _, _, syncer_pathlike = self.protocol.rpartition("@")
             syncer_dir = pathlib.Path(syncer_pathlike)
         else:
-            syncer_dir = utils.get_package_directory("cs_tools") / "sync" / self.protocol
+            syncer_dir = CS_TOOLS_PKG_DIR / "sync" / self.protocol
 
-        manifest = base.SyncerManifest.model_validate_json(syncer_dir.joinpath("MANIFEST.json").read_text())
+        manifest = base.load_manifest(syncer_dir)
         SyncerClass = manifest.import_syncer_class(fp=syncer_dir / "syncer.py")
 
         if self.definition_fp:
             try:
-                conf = toml.load(self.definition_fp)
-            except toml.TomlDecodeError as e:
-                text = self.definition_fp.read_text()
-                line = text.splitlines()[e.lineno - 1]
-                trim = line if len(line) < 5 else f"{line[:5]}..."
+                conf = load_toml(self.definition_fp)
+            except ValueError as e:  # toml.TomlDecodeError and tomllib.TOMLDecodeError are both ValueErrors
+                if (lineno := getattr(e, "lineno", None)) is not None:
+                    line = self.definition_fp.read_text().splitlines()[lineno - 1]
+                    trim = line if len(line) < 5 else f"{line[:5]}..."
+                    where = f"error on line {lineno} beginning with '{trim}'"
+                else:
+                    where = f"{e}"
+
                 raise errors.CSToolsError(
-                    f"Could not parse syncer definition syntax, error on line {e.lineno} beginning with '{trim}'"
+                    f"Could not parse syncer definition syntax, {where}"
                     f"\nSyncer definition path:  {self.definition_fp}"
                 ) from None
         else:
@@ -77,6 +77,11 @@ class KeyboardListener:
 
     async def start(self, *, ignore_control_c: bool = False) -> None:
         """Start the KeyboardListener."""
+        # most key hooks finish without ever suspending; eager tasks (3.12+) run them
+        # to completion immediately instead of paying a scheduler round-trip
+        if hasattr(asyncio, "eager_task_factory"):
+            asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
         self._is_accepting_keys = True
         self._input_pipe = create_input()
         self._background_done = asyncio.Event()
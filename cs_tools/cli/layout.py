@@ -69,6 +69,7 @@ class WorkTask:
     def __post_init__(self):
         self._total_duration: dt.timedelta = dt.timedelta(seconds=0)
         self._started_at: dt.datetime = None
+        self._started_at_rendered: str = ""
         self._skipped = False
         self._stopped = False
 
@@ -85,9 +86,10 @@ class WorkTask:
 
     @property
     def values(self) -> tuple[str]:
-        started_at = "" if self.started_at is None else self.started_at.strftime("%H:%M:%S")
+        # .values is recomputed on every Live refresh tick -- the start time never
+        # changes while the task runs, so render it once in .start()
         duration = "" if self.started_at is None else f"{self.duration.total_seconds(): >6.2f}"
-        return self.status, started_at, duration, self.description
+        return self.status, self._started_at_rendered, duration, self.description
 
     def skip(self) -> None:
         self._skipped = True
@@ -96,6 +98,7 @@ class WorkTask:
     def start(self) -> None:
         self.status = ":fire:"
         self._started_at = dt.datetime.now(tz=dt.timezone.utc)
+        self._started_at_rendered = self._started_at.strftime("%H:%M:%S")
         self._stopped = False
 
     def stop(self, error: bool = False) -> None:
@@ -24,6 +24,9 @@ from . import _extended_rest_api_v1, layout, models
 log = logging.getLogger(__name__)
 ALL_BI_SERVER_HISTORY_IMPOSSIBLE_THRESHOLD_VALUE = 3650
 
+# system type -> display name, computed once instead of per preview row
+FRIENDLY_TYPE_NAMES = {member.value: member.name.title().replace("_", " ") for member in MetadataObjectType}
+
 
 class ContentType(StrEnum):
     answer = "answer"
@@ -134,16 +137,17 @@ def identify(
             ts_bi_data = {row["Answer Book GUID"] for row in ts_bi_rows}
 
         with tasks["gather_supporting_filter_criteria"]:
-            only_user_guids = [
+            # sets, not lists -- the author checks below run once per metadata object
+            only_user_guids = {
                 user["id"]
                 for group in (only_groups or [])
                 for user in ts.group.users_in(group, is_directly_assigned=True)
-            ]
-            ignore_user_guids = [
+            }
+            ignore_user_guids = {
                 user["id"]
                 for group in (ignore_groups or [])
                 for user in ts.group.users_in(group, is_directly_assigned=True)
-            ]
+            }
 
         with tasks["gather_metadata"]:
             all_object = []
@@ -211,7 +215,7 @@ def identify(
             # for row in random.sample(to_archive, k=min(25, len(to_archive))):
             for row in sorted(to_archive, key=lambda model: model.modified, reverse=True)[:25]:
                 table.add_row(
-                    MetadataObjectType(row.type).name.title().replace("_", " "),
+                    FRIENDLY_TYPE_NAMES[row.type],
                     row.guid,
                     row.modified.strftime("%Y-%m-%d"),
                     row.author,
@@ -343,7 +347,7 @@ def revert(
 
             for row in random.sample(to_revert, k=min(25, len(to_revert))):
                 table.add_row(
-                    MetadataObjectType(row.type).name.title().replace("_", " "),
+                    FRIENDLY_TYPE_NAMES[row.type],
                     row.guid,
                     row.modified.strftime("%Y-%m-%d"),
                     row.author,
@@ -498,7 +502,7 @@ def remove(
 
             for row in random.sample(to_delete, k=min(25, len(to_delete))):
                 table.add_row(
-                    MetadataObjectType(row.type).name.title().replace("_", " "),
+                    FRIENDLY_TYPE_NAMES[row.type],
                     row.guid,
                     row.modified.strftime("%Y-%m-%d"),
                     row.author,
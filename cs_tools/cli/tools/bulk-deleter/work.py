@@ -37,24 +37,27 @@ def _validate_objects_exist(ts, data: list[TableRowsFormat]) -> list[types.Delet
         (liveboards, "PINBOARD_ANSWER_BOOK"),
     )
 
+    missing: set[str] = set()
+
     for objects, content_type in content_to_filter:
         for chunk in utils.batched(objects, n=25):
             batch = list(chunk)
             r = ts.api.v1.metadata_list(metadata_type=content_type, fetch_guids=[c.object_guid for c in batch])
-            headers = r.json()["headers"]
+
+            # index once per response instead of scanning the headers list per object
+            headers_by_guid = {header["id"]: header for header in r.json()["headers"]}
 
             for content in batch:
-                header = utils.find(lambda h, c=content: h["id"] == c.object_guid, headers)
+                header = headers_by_guid.get(content.object_guid)
 
                 if header is not None:
                     content.object_name = header["name"]
                     continue
 
                 log.warning(f"{content.object_guid} is not a {content_type}, removing it from the delete record..")
+                missing.add(content.object_guid)
 
-                try:
-                    data.remove(content)
-                except ValueError:
-                    pass
+    if missing:
+        data = [content for content in data if content.object_guid not in missing]
 
     return data
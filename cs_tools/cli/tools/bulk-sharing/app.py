@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import concurrent.futures as cf
 import logging
 
 from thoughtspot_tml import _yaml
 import typer
 import uvicorn
 
+from cs_tools import utils
 from cs_tools.cli.dependencies import thoughtspot
 from cs_tools.cli.ux import CSToolsApp, rich_console
 from cs_tools.types import GUID, ShareModeAccessLevel
@@ -14,6 +16,9 @@ from . import work
 from .web_app import _scoped
 
 log = logging.getLogger(__name__)
+
+# How many tables to send in a single /security/share call.
+_SHARE_CHUNKSIZE = 200
 app = CSToolsApp(
     help="""
     Scalably manage your table- and column-level security right in the browser.
@@ -105,11 +110,24 @@ def single(
         rich_console.log("No tables found..")
         raise typer.Exit()
 
-    r = ts.api.v1.security_share(
-        metadata_type="LOGICAL_TABLE", guids=table_ids, permissions={group_id: str(permission)}
-    )
-    status = "[b green]Success" if r.is_success else "[b red]Failed[/]"
+    # the share endpoint takes the full guid list in one call, but very large
+    # connections can exceed the server's request limits -- chunk as a safety net
+    # and issue the chunks concurrently
+    with cf.ThreadPoolExecutor(max_workers=4, thread_name_prefix="security-share") as pool:
+        futures = [
+            pool.submit(
+                ts.api.v1.security_share,
+                metadata_type="LOGICAL_TABLE",
+                guids=list(chunk),
+                permissions={group_id: str(permission)},
+            )
+            for chunk in utils.batched(table_ids, n=_SHARE_CHUNKSIZE)
+        ]
+
+    responses = [future.result() for future in futures]
+    status = "[b green]Success" if all(r.is_success for r in responses) else "[b red]Failed[/]"
     rich_console.log(f"Sharing with group [b blue]{group}[/]: {status}")
 
-    if r.status_code != 204:
-        log.error(r.content)
+    for chunk, r in zip(utils.batched(table_ids, n=_SHARE_CHUNKSIZE), responses):
+        if r.status_code != 204:
+            log.error(f"failed to share {len(chunk)} tables (HTTP {r.status_code})\n{r.content}")
@@ -1,12 +1,27 @@
 from __future__ import annotations
 
+import functools as ft
 import socket
 
 
+@ft.cache
 def _find_my_local_ip() -> str:
     """
     Gets the local ip, or loopback address if not found.
+
+    The result is cached -- resolving the outbound interface can stall for
+    hundreds of milliseconds in heavily firewalled environments.
     """
+    try:
+        # cheap path: resolve our own hostname
+        ip = socket.gethostbyname(socket.gethostname())
+
+        if not ip.startswith("127."):
+            return ip
+    except OSError:
+        pass
+
+    # fallback: "connect" a UDP socket and read the OS-selected source address
     with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
         sock.connect(("10.255.255.255", 1))  # does not need to be a valid addr
 
@@ -19,6 +19,17 @@ from cs_tools.cli.ux import CSToolsApp, rich_console
 log = logging.getLogger(__name__)
 app = CSToolsApp(help="Extract data from a worksheet, view, or table in ThoughtSpot.")
 
+# ThoughtSpot generic type -> sqlalchemy type, built once instead of per extraction
+SQLA_DATA_TYPES = {
+    "CHAR": Text,
+    "BOOL": Boolean,
+    "FLOAT": Float,
+    "INT32": SmallInteger,
+    "INT64": BigInteger,
+    "DATE": Date,
+    "DATE_TIME": DateTime,
+}
+
 
 class SearchableDataSource(StrEnum):
     worksheet = "worksheet"
@@ -100,16 +111,6 @@ def search(
                     "cluster_guid": (str, Field(sa_column=Column(Text, primary_key=True))),
                 }
 
-                sqla_types = {
-                    "CHAR": Text,
-                    "BOOL": Boolean,
-                    "FLOAT": Float,
-                    "INT32": SmallInteger,
-                    "INT64": BigInteger,
-                    "DATE": Date,
-                    "DATE_TIME": DateTime,
-                }
-
                 # Compute the column definitions
                 for column, ts_generic_type in column_mapping.items():
                     if column == "sk_dummy":
@@ -119,7 +120,7 @@ def search(
                     py_type = type(renamed[0][column])
 
                     # Fetch the complementary sqlalchemy type
-                    sa_type = sqla_types.get(ts_generic_type, None)
+                    sa_type = SQLA_DATA_TYPES.get(ts_generic_type, None)
 
                     if sa_type is None:
                         log.warning(f"Unknown type: {ts_generic_type} for column: {column}, falling back to VARCHAR..")
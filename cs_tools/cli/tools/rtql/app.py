@@ -9,6 +9,9 @@ import typer
 from cs_tools.cli.dependencies.thoughtspot import thoughtspot, thoughtspot_nologin
 from cs_tools.cli.ux import CSToolsApp, rich_console
 
+# message severity -> console markup, built once instead of per command
+COLOR_MAP = {"INFO": "[white]", "ERROR": "[red]"}
+
 app = CSToolsApp(
     help="""
     Enable querying the ThoughtSpot TQL CLI from a remote machine.
@@ -57,12 +60,10 @@ def file(
     ts = ctx.obj.thoughtspot
     r = ts.tql.script(file)
 
-    color_map = {"INFO": "[white]", "ERROR": "[red]"}
-
     for response in r:
         if "messages" in response:
             for message in response["messages"]:
-                c = color_map.get(message["type"], "[yellow]")
+                c = COLOR_MAP.get(message["type"], "[yellow]")
                 m = message["value"]
 
                 if m.strip() == "Statement executed successfully.":
@@ -103,12 +104,10 @@ def command(
 
     r = ts.tql.command(command, schema_=schema)
 
-    color_map = {"INFO": "[white]", "ERROR": "[red]"}
-
     for response in r:
         if "messages" in response:
             for message in response["messages"]:
-                c = color_map.get(message["type"], "[yellow]")
+                c = COLOR_MAP.get(message["type"], "[yellow]")
                 m = message["value"]
 
                 if m.strip() == "Statement executed successfully.":
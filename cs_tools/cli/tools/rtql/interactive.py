@@ -19,6 +19,9 @@ if TYPE_CHECKING:
 
 log = logging.getLogger(__name__)
 
+# message severity -> console markup, built once instead of per query
+COLOR_MAP = {"INFO": "[white]", "WARNING": "[yellow]", "ERROR": "[red]"}
+
 
 def _to_table(headers, rows=None):
     header = [column["name"] for column in headers]
@@ -153,7 +156,6 @@ class InteractiveTQL:
 
     def _handle_query(self, lines: list[str]) -> None:
         """ """
-        color_map = {"INFO": "[white]", "WARNING": "[yellow]", "ERROR": "[red]"}
         new_ctx = {}
 
         for line in lines:
@@ -177,7 +179,7 @@ class InteractiveTQL:
 
             if "message" in data["result"]:
                 for message in data["result"]["message"]:
-                    c = color_map.get(message["type"], "[yellow]")
+                    c = COLOR_MAP.get(message["type"], "[yellow]")
                     m = message["value"]
 
                     if m.strip() == "Statement executed successfully.":
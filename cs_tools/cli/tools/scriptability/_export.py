@@ -3,6 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Optional
 import collections
+import concurrent.futures as cf
 import logging
 import re
 
@@ -249,8 +250,14 @@ def _download_tml(ts, tmlfs: ExportTMLFS, guid: GUID, export_associated: bool) -
 
             disambiguate(tml, guid_mapping=guid_name_map)
 
-    for tml in tml_objects:
-        tmlfs.write_tml(tml=tml)
+    # serialization + disk writes are independent per-object; overlap them so a slow
+    # disk doesn't serialize a large `--export-associated` batch
+    if len(tml_objects) > 1:
+        with cf.ThreadPoolExecutor(max_workers=4, thread_name_prefix="tml-write") as pool:
+            list(pool.map(lambda tml: tmlfs.write_tml(tml=tml), tml_objects))
+    else:
+        for tml in tml_objects:
+            tmlfs.write_tml(tml=tml)
 
     return results
 
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, NewType
+from typing import TYPE_CHECKING, NewType, Optional
 import pathlib
 
 from thoughtspot_tml import Connection
@@ -43,6 +43,9 @@ class GUIDMapping:
         self.path: pathlib.Path = path
         self.remap_object_guid = remap_object_guid
         self.guid_mapper = Mapper.read(path, str.lower) if path.exists() else Mapper(str.lower)
+        # generate_mapping() rebuilds the full env->env table; cache it across
+        # disambiguate() calls and invalidate whenever the mapper is written to
+        self._mapping_cache: Optional[dict[GUID, GUID]] = None
 
     def get_mapped_guid(self, from_guid: GUID) -> GUID:
         """
@@ -60,6 +63,7 @@ class GUIDMapping:
         """
         self.guid_mapper[from_guid] = (self.source, from_guid)
         self.guid_mapper[from_guid] = (self.dest, to_guid)
+        self._mapping_cache = None
 
     def set_mapped_guids(self, from_guids: list[GUID], to_guids: list[GUID]) -> None:
         """
@@ -76,7 +80,10 @@ class GUIDMapping:
         Replaces source GUIDs with target.
         """
         # self.guid_mapper.generate_map(DEV, PROD) # =>  {envt_A_guid1: envt_B_guid2 , .... }
-        mapper = self.guid_mapper.generate_mapping(self.source, self.dest)
+        if self._mapping_cache is None:
+            self._mapping_cache = self.guid_mapper.generate_mapping(self.source, self.dest)
+
+        mapper = self._mapping_cache
 
         _disambiguate(
             tml=tml,
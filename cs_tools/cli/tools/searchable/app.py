@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import concurrent.futures as cf
 import datetime as dt
+import functools as ft
 import json
 import logging
 import pathlib
@@ -198,6 +200,7 @@ def audit_logs(
     everseen = set()
 
     renamed = []
+    cluster_guid = ts.session_context.thoughtspot.cluster_id
 
     for days_to_fetch in range(last_k_days):
         utc_end = utc_terminal_end - dt.timedelta(days=days_to_fetch)
@@ -219,19 +222,20 @@ def audit_logs(
 
         for row in rows:
             data = json.loads(row["log"])
+            sk_dummy = f"{cluster_guid}-{data['id']}"
 
             # THOUGHTSPOT API SEEMS TO HAVE ISSUES WITH TIMEZONES AND CAUSES DUPLICATION OF DATA
-            if f"{ts.session_context.thoughtspot.cluster_id}-{data['id']}" in everseen:
+            if sk_dummy in everseen:
                 continue
 
-            everseen.add(f"{ts.session_context.thoughtspot.cluster_id}-{data['id']}")
+            everseen.add(sk_dummy)
 
             renamed.append(
                 models.AuditLogs.validated_init(
                     **{
-                        "cluster_guid": ts.session_context.thoughtspot.cluster_id,
+                        "cluster_guid": cluster_guid,
                         "org_id": data["orgId"],
-                        "sk_dummy": f"{ts.session_context.thoughtspot.cluster_id}-{data['id']}",
+                        "sk_dummy": sk_dummy,
                         "timestamp": row["date"],
                         "log_type": data["type"],
                         "user_guid": data["userGUID"],
@@ -464,12 +468,15 @@ def metadata(
             # user
             # group_membership
             r = ts.api.v1.user_read()
+            # httpx does not cache .json() -- decode the (large) user listing once
+            user_data = r.json()
             members = {m["user_guid"] for m in temp_sync.load(models.User.__tablename__)}
             temp_sync.dump(
-                models.User.__tablename__, data=transform.to_user(r.json(), cluster=cluster_uuid, ever_seen=members)
+                models.User.__tablename__, data=transform.to_user(user_data, cluster=cluster_uuid, ever_seen=members)
             )
             temp_sync.dump(
-                models.GroupMembership.__tablename__, data=transform.to_group_membership(r.json(), cluster=cluster_uuid)
+                models.GroupMembership.__tablename__,
+                data=transform.to_group_membership(user_data, cluster=cluster_uuid),
             )
             row[2] = ":file_folder:"
 
@@ -495,11 +502,22 @@ def metadata(
 
             row[5] = ":fire:"
             # metadata
-            content = [
-                *ts.logical_table.all(exclude_system_content=False, include_data_source=True, raise_on_error=False),
-                *ts.answer.all(exclude_system_content=False, raise_on_error=False),
-                *ts.liveboard.all(exclude_system_content=False, raise_on_error=False),
-            ]
+            # three independent paginated call chains -- run them concurrently, then
+            # stitch the results together in the original order
+            with cf.ThreadPoolExecutor(max_workers=3, thread_name_prefix="metadata-list") as pool:
+                futures = [
+                    pool.submit(
+                        ft.partial(
+                            ts.logical_table.all,
+                            exclude_system_content=False,
+                            include_data_source=True,
+                            raise_on_error=False,
+                        )
+                    ),
+                    pool.submit(ft.partial(ts.answer.all, exclude_system_content=False, raise_on_error=False)),
+                    pool.submit(ft.partial(ts.liveboard.all, exclude_system_content=False, raise_on_error=False)),
+                ]
+                content = [header for future in futures for header in future.result()]
 
             members = {
                 (m["cluster_guid"], m["org_id"], m["object_guid"])
@@ -39,9 +39,9 @@ def to_org(data: ArbitraryJsonFormat, cluster: str) -> TableRowsFormat:
             org_id=data["orgId"],
             name=data["orgName"],
             description=data["description"],
-        )
+        ).model_dump()
     )
-    return [model.model_dump() for model in out]
+    return out
 
 
 def to_group(data: ArbitraryJsonFormat, cluster: str) -> TableRowsFormat:
@@ -66,10 +66,10 @@ def to_group(data: ArbitraryJsonFormat, cluster: str) -> TableRowsFormat:
                     created=row["header"]["created"] / 1000,
                     modified=row["header"]["modified"] / 1000,
                     group_type=row["type"],
-                )
+                ).model_dump()
             )
 
-    return [model.model_dump() for model in out]
+    return out
 
 
 def to_group_privilege(data: ArbitraryJsonFormat, cluster: str) -> TableRowsFormat:
@@ -85,10 +85,10 @@ def to_group_privilege(data: ArbitraryJsonFormat, cluster: str) -> TableRowsForm
             out.append(
                 models.GroupPrivilege.validated_init(
                     cluster_guid=cluster, group_guid=row["header"]["id"], privilege=privilege
-                )
+                ).model_dump()
             )
 
-    return [model.model_dump() for model in out]
+    return out
 
 
 def to_user(data: ArbitraryJsonFormat, ever_seen: set[str], cluster: str) -> TableRowsFormat:
@@ -114,10 +114,10 @@ def to_user(data: ArbitraryJsonFormat, ever_seen: set[str], cluster: str) -> Tab
                 created=row["header"]["created"] / 1000,
                 modified=row["header"]["modified"] / 1000,
                 user_type=row["type"],
-            )
+            ).model_dump()
         )
 
-    return [model.model_dump() for model in out]
+    return out
 
 
 def to_org_membership(data: ArbitraryJsonFormat, cluster: str, ever_seen: set[tuple[str, ...]]) -> TableRowsFormat:
@@ -137,9 +137,9 @@ def to_org_membership(data: ArbitraryJsonFormat, cluster: str, ever_seen: set[tu
             if (model.cluster_guid, model.user_guid, str(model.org_id)) in ever_seen:
                 continue
 
-            out.append(model)
+            out.append(model.model_dump())
 
-    return [model.model_dump() for model in out]
+    return out
 
 
 def to_group_membership(data: ArbitraryJsonFormat, cluster: str) -> TableRowsFormat:
@@ -155,10 +155,10 @@ def to_group_membership(data: ArbitraryJsonFormat, cluster: str) -> TableRowsFor
             out.append(
                 models.GroupMembership.validated_init(
                     cluster_guid=cluster, principal_guid=row["header"]["id"], group_guid=group
-                )
+                ).model_dump()
             )
 
-    return [model.model_dump() for model in out]
+    return out
 
 
 def to_tag(data: ArbitraryJsonFormat, cluster: str) -> TableRowsFormat:
@@ -181,10 +181,10 @@ def to_tag(data: ArbitraryJsonFormat, cluster: str) -> TableRowsFormat:
                     author_guid=row["author"],
                     created=row["created"] / 1000,
                     modified=row["modified"] / 1000,
-                )
+                ).model_dump()
             )
 
-    return [model.model_dump() for model in out]
+    return out
 
 
 def to_data_source(data: ArbitraryJsonFormat, cluster: str) -> TableRowsFormat:
@@ -252,9 +252,9 @@ def to_metadata_object(data: ArbitraryJsonFormat, cluster: str, ever_seen: set[t
             if (model.cluster_guid, str(model.org_id), model.object_guid) in ever_seen:
                 continue
 
-            out.append(model)
+            out.append(model.model_dump())
 
-    return [model.model_dump() for model in out]
+    return out
 
 
 def to_metadata_column(data: ArbitraryJsonFormat, cluster: str) -> TableRowsFormat:
@@ -266,9 +266,9 @@ def to_metadata_column(data: ArbitraryJsonFormat, cluster: str) -> TableRowsForm
     out: TableRowsFormat = []
 
     for row in data:
-        out.append(models.MetadataColumn.validated_init(cluster_guid=cluster, **row))
+        out.append(models.MetadataColumn.validated_init(cluster_guid=cluster, **row).model_dump())
 
-    return [model.model_dump() for model in out]
+    return out
 
 
 def to_column_synonym(data: ArbitraryJsonFormat, cluster: str) -> TableRowsFormat:
@@ -280,7 +280,7 @@ def to_column_synonym(data: ArbitraryJsonFormat, cluster: str) -> TableRowsForma
     SOURCE: /tspublic/v1/metadata/list ? type = LOGICAL_COLUMN  (cs_tools.middleswares.metadata.columns)
     """
     ever_seen: set[tuple] = set()
-    sanitized: list[models.ColumnSynonym] = []
+    sanitized: TableRowsFormat = []
 
     for row in data:
         for synonym in row["synonyms"]:
@@ -292,16 +292,17 @@ def to_column_synonym(data: ArbitraryJsonFormat, cluster: str) -> TableRowsForma
                 column_guid=row["column_guid"],
                 synonym=synonym,
             )
-            unique = tuple(model.model_dump().values())
+            dumped = model.model_dump()
+            unique = tuple(dumped.values())
 
             if unique in ever_seen:
                 log.info(f"Column {model.column_guid} from {row['object_guid']} has duplicate synonym: {model.synonym}")
                 continue
 
             ever_seen.add(unique)
-            sanitized.append(model)
+            sanitized.append(dumped)
 
-    return [row.model_dump() for row in sanitized]
+    return sanitized
 
 
 def to_tagged_object(data: ArbitraryJsonFormat, cluster: str) -> TableRowsFormat:
@@ -319,10 +320,10 @@ def to_tagged_object(data: ArbitraryJsonFormat, cluster: str) -> TableRowsFormat
                     cluster_guid=cluster,
                     object_guid=row["id"],
                     tag_guid=tag["id"],
-                )
+                ).model_dump()
             )
 
-    return [model.model_dump() for model in out]
+    return out
 
 
 def to_dependent_object(data: ArbitraryJsonFormat, cluster: str) -> TableRowsFormat:
@@ -348,10 +349,10 @@ def to_dependent_object(data: ArbitraryJsonFormat, cluster: str) -> TableRowsFor
                 object_subtype=row.get("type", None),
                 is_verified=row.get("isVerified", False) if row["metadata_type"] == "PINBOARD_ANSWER_BOOK" else None,
                 is_version_controlled=row.get("isVersioningEnabled", False),
-            )
+            ).model_dump()
         )
 
-    return [model.model_dump() for model in out]
+    return out
 
 
 def to_sharing_access(data: ArbitraryJsonFormat, cluster: str) -> TableRowsFormat:
@@ -373,7 +374,7 @@ def to_sharing_access(data: ArbitraryJsonFormat, cluster: str) -> TableRowsForma
                 shared_to_group_guid=row.get("shared_to_group_guid", None),
                 permission_type=row["permission_type"],
                 share_mode=row["share_mode"],
-            )
+            ).model_dump()
         )
 
-    return [model.model_dump() for model in out]
+    return out
@@ -18,17 +18,17 @@ from cs_tools.errors import ConfigDoesNotExist
 
 log = logging.getLogger(__name__)
 
+# TypeAdapter construction compiles a validator (expensive); build it once at import
+# instead of once per CLI parameter conversion.
+_DIRECTORY_PATH_ADAPTER = pydantic.TypeAdapter(pydantic.DirectoryPath)
+
 
 class Directory(click.ParamType):
     name = "directory"
 
-    @pydantic.validate_call
-    def validate(self, value: pydantic.DirectoryPath) -> pathlib.Path:
-        return value
-
     def convert(self, value, param, ctx):  # noqa: ARG002
         try:
-            return self.validate(value)
+            return _DIRECTORY_PATH_ADAPTER.validate_python(value)
         except pydantic.ValidationError as e:
             error_string = []
 
@@ -55,13 +55,29 @@ class MultipleChoiceType(click.ParamType):
         return [self.return_type(v) for v in it.chain.from_iterable(values) if v != ""]
 
 
+# Dynamic enum construction builds a whole new class object; click instantiates
+# ParamTypes per command, so build this once and share it across instances.
+_METADATA_TYPE_ENUM = StrEnum(
+    "MetadataType", ["connection", "table", "view", "sql_view", "worksheet", "liveboard", "answer"]
+)
+
+# friendly name -> (system type, subtype), built once instead of per conversion
+_SYSTEM_TYPE_MAP = {
+    "connection": ("DATA_SOURCE", None),
+    "table": ("LOGICAL_TABLE", "ONE_TO_ONE_LOGICAL"),
+    "view": ("LOGICAL_TABLE", "AGGR_WORKSHEET"),
+    "sql_view": ("LOGICAL_TABLE", "SQL_VIEW"),
+    "worksheet": ("LOGICAL_TABLE", "WORKSHEET"),
+    "liveboard": ("PINBOARD_ANSWER_BOOK", None),
+    "answer": ("QUESTION_ANSWER_BOOK", None),
+}
+
+
 class MetadataType(click.ParamType):
     def __init__(self, to_system_types: bool = False, include_subtype: bool = False):
         self.to_system_types = to_system_types
         self.include_subtype = include_subtype
-        self.enum = StrEnum(
-            "MetadataType", ["connection", "table", "view", "sql_view", "worksheet", "liveboard", "answer"]
-        )
+        self.enum = _METADATA_TYPE_ENUM
 
     def get_metavar(self, _param) -> str:
         return "|".join(self.enum)
@@ -86,16 +102,7 @@ class MetadataType(click.ParamType):
         return value
 
     def convert_system_types(self, value) -> tuple[str, str]:
-        mapping = {
-            "connection": ("DATA_SOURCE", None),
-            "table": ("LOGICAL_TABLE", "ONE_TO_ONE_LOGICAL"),
-            "view": ("LOGICAL_TABLE", "AGGR_WORKSHEET"),
-            "sql_view": ("LOGICAL_TABLE", "SQL_VIEW"),
-            "worksheet": ("LOGICAL_TABLE", "WORKSHEET"),
-            "liveboard": ("PINBOARD_ANSWER_BOOK", None),
-            "answer": ("QUESTION_ANSWER_BOOK", None),
-        }
-        return mapping[value]
+        return _SYSTEM_TYPE_MAP[value]
 
 
 class CommaSeparatedValuesType(click.ParamType):
@@ -113,8 +120,10 @@ class CommaSeparatedValuesType(click.ParamType):
         if value is None:
             return None
 
+        # normalize to a list-of-lists -- a bare string would otherwise be flattened
+        # character-by-character by chain.from_iterable below
         if isinstance(value, str):
-            values = value.split(",")
+            values = [value.split(",")]
 
         elif isinstance(value, collections.abc.Iterable):
             values = [v.split(",") if isinstance(v, str) else v for v in value]
@@ -160,8 +169,16 @@ class SyncerProtocolType(click.ParamType):
 
             return {"definition_fp": definition_fp}
 
-        query_string = urllib.parse.urlparse(f"proto://?{definition}").query
-        definition_kw = {k: vs[0] for k, vs in urllib.parse.parse_qs(query_string).items()}
+        # the spec is already a flat `k=v&k=v` string -- no need to wrap it in a fake
+        # URL and pay for full URL + querystring parsing just to flatten it back out
+        definition_kw = {}
+
+        for pair in definition.split("&"):
+            key, _, value = pair.partition("=")
+
+            if key and value and key not in definition_kw:
+                definition_kw[urllib.parse.unquote_plus(key)] = urllib.parse.unquote_plus(value)
+
         return {"definition_kw": definition_kw}
 
     def convert(self, value, param, ctx):  # noqa: ARG002
@@ -79,8 +79,12 @@ class ValidatedSQLModel(sqlmodel.SQLModel):
     def validated_init(cls, context: Any = None, **data):
         # defaults  = cls.read_from_environment()
         # sanitized = cls.model_validate({**defaults, **data})
-        sanitized = cls.model_validate(data, context=context)
-        return cls(**sanitized.model_dump())
+        #
+        # .model_validate() both validates and constructs the instance; round-tripping
+        # it through model_dump()/__init__ would only rebuild what we already have, and
+        # this runs once per row on extract paths. Extra fields are filtered at
+        # serialization time by _ignore_extras either way.
+        return cls.model_validate(data, context=context)
 
     @property
     def clustered_on(self) -> list[sa.Column]:
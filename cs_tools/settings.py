@@ -34,6 +34,9 @@ from cs_tools.updater._bootstrapper import get_latest_cs_tools_release
 log = logging.getLogger(__name__)
 _FOUNDING_DAY = dt.datetime(year=2012, month=6, day=1, tzinfo=dt.timezone.utc)
 
+# AwesomeVersion parses on construction; our own version never changes in-process
+_VENV_VERSION = AwesomeVersion(__version__)
+
 
 class AnalyticsOptIn(_GlobalModel):
     """Information the User confirmed to us in order to check analytics."""
@@ -157,7 +160,7 @@ class MetaConfig(_GlobalModel):
     def check_remote_version(self) -> None:
         """Check GitHub for the latest cs_tools version."""
         TIMEOUT_AFTER = 0.33
-        venv_version = AwesomeVersion(__version__)
+        venv_version = _VENV_VERSION
 
         # DONT CHECK REMOTE TOO OFTEN
         # - every 5 hours for BETA
@@ -185,7 +188,7 @@ class MetaConfig(_GlobalModel):
 
     def newer_version_string(self) -> str:
         """Return the CLI new version media string."""
-        if AwesomeVersion(self.remote.version or "v0.0.0") <= AwesomeVersion(__version__):
+        if AwesomeVersion(self.remote.version or "v0.0.0") <= _VENV_VERSION:
             return ""
 
         assert self.remote is not None
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, Literal, Optional
+import collections
 import functools as ft
 import importlib.util
 import logging
@@ -75,16 +76,32 @@ class SyncerManifest(_GlobalModel):
         if __syncer_name__ in _registry:
             return
 
+        # one resolver run per distinct set of pip args, instead of one pip subprocess
+        # per requirement -- each subprocess costs seconds of startup alone
+        by_pip_args: dict[tuple[str, ...], list[str]] = collections.defaultdict(list)
+
         for pip_requirement in self.requirements:
             log.debug(f"Processing requirement: {pip_requirement}")
-            cs_tools_venv.pip(
-                "install", f"{pip_requirement.requirement}", *pip_requirement.pip_args, base_log_level="DEBUG"
-            )
+            by_pip_args[tuple(pip_requirement.pip_args)].append(f"{pip_requirement.requirement}")
+
+        for pip_args, requirements in by_pip_args.items():
+            cs_tools_venv.pip("install", *requirements, *pip_args, base_log_level="DEBUG")
 
         # Registration is successful, we can add it to the global now.
         _registry.add(__syncer_name__)
 
 
+@ft.cache
+def load_manifest(syncer_dir: pathlib.Path) -> SyncerManifest:
+    """
+    Parse a syncer's MANIFEST.json.
+
+    Manifests are static files shipped with the package, so each one is only parsed
+    once per process.
+    """
+    return SyncerManifest.model_validate_json(syncer_dir.joinpath("MANIFEST.json").read_bytes())
+
+
 class Syncer(_GlobalSettings):
     """A connection to a Data store."""
 
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 from typing import Any
 import datetime as dt
-import json
 
 
 def clean_datetime(o: Any) -> str:
@@ -32,4 +31,6 @@ def clean_for_bq(data: list[dict[str, Any]]) -> list[dict[str, str]]:
     -------
     cleaned : List[Dict[str, str]]
     """
-    return json.loads(json.dumps(data, default=clean_datetime))
+    # reformat in a single direct pass instead of round-tripping the whole dataset
+    # through json.dumps/json.loads
+    return [{key: clean_datetime(value) for key, value in row.items()} for row in data]
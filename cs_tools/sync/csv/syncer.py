@@ -147,4 +147,6 @@ class CSV(Syncer):
                 self._written_header[filename] = True
                 writer.writeheader()
 
-            writer.writerows([sync_utils.format_datetime_values(r, dt_format=self.date_time_format) for r in data])
+            # stream rows through the writer -- a list comprehension here would hold a
+            # second formatted copy of the full dataset in memory
+            writer.writerows(sync_utils.format_datetime_values(r, dt_format=self.date_time_format) for r in data)
@@ -43,8 +43,16 @@ def clean_datetime(object_: Any) -> str:
 
 def roundtrip_json_for_falcon(data: TableRows) -> TableRows:
     """
-    Round-trip from JSON to sanitize.
+    Sanitize rows for Falcon.
 
-    Falcon accepts datetimes in a specific format.
+    Falcon accepts datetimes in a specific format. This used to round-trip the whole
+    dataset through json.dumps/json.loads just to reformat the datetime values --
+    serializing megabytes of already-clean rows. Reformat in a single direct pass.
     """
-    return json.loads(json.dumps(data, default=clean_datetime))
+    return [
+        {
+            key: value.strftime(FMT_TSLOAD_DATETIME) if isinstance(value, dt.datetime) else value
+            for key, value in row.items()
+        }
+        for row in data
+    ]
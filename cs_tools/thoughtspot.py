@@ -2,8 +2,10 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Optional
 import collections
+import datetime as dt
 import json
 import logging
+import threading
 
 import httpx
 
@@ -31,6 +33,9 @@ if TYPE_CHECKING:
 
 log = logging.getLogger(__name__)
 
+# ThoughtSpot's default idle session timeout is 20 minutes, ping well within it
+_KEEPALIVE_INTERVAL_SECONDS = 60 * 5
+
 
 class ThoughtSpot:
     """
@@ -42,6 +47,8 @@ class ThoughtSpot:
     def __init__(self, config: CSToolsConfig, auto_login: bool = False):
         self.config = config
         self._session_context: Optional[SessionContext] = None
+        self._keepalive_thread: Optional[threading.Thread] = None
+        self._keepalive_stopped = threading.Event()
         self.api = RESTAPIClient(
             ts_url=str(config.thoughtspot.url),
             verify=not config.thoughtspot.disable_ssl,
@@ -77,6 +84,43 @@ class ThoughtSpot:
 
         return self._session_context
 
+    def _start_keepalive(self) -> None:
+        """Keep the ThoughtSpot session warm while CS Tools is running."""
+        if self._keepalive_thread is not None:
+            return
+
+        self._keepalive_stopped.clear()
+        self._keepalive_thread = threading.Thread(target=self.__keepalive__, name="ts-session-keepalive", daemon=True)
+        self._keepalive_thread.start()
+
+    def __keepalive__(self) -> None:
+        """Periodically ping ThoughtSpot, but only when CS Tools has otherwise been idle."""
+        while not self._keepalive_stopped.wait(timeout=_KEEPALIVE_INTERVAL_SECONDS):
+            # ANY RECENT API TRAFFIC ALREADY KEEPS THE SESSION ALIVE, SKIP THE PING
+            if (last_traffic_at := self.api.last_traffic_at) is not None:
+                idle_for = (dt.datetime.now(tz=dt.timezone.utc) - last_traffic_at).total_seconds()
+
+                if idle_for < _KEEPALIVE_INTERVAL_SECONDS:
+                    continue
+
+            try:
+                self.api.v1.session_info()
+            except httpx.HTTPError as e:
+                log.debug(f"Session keepalive ping failed: {e}")
+            except Exception:
+                # never let the watchdog die silently mid-session
+                log.debug("Unexpected error in the session keepalive", exc_info=True)
+
+    def _stop_keepalive(self) -> None:
+        """Stop the keepalive watchdog and wait for it to wind down."""
+        self._keepalive_stopped.set()
+
+        if self._keepalive_thread is not None:
+            # the thread either sees the event immediately, or is mid-ping; don't hang
+            # interactive shutdown on a slow cluster
+            self._keepalive_thread.join(timeout=5)
+            self._keepalive_thread = None
+
     def _attempt_do_authenticate(self, authentication_method, **authentication_keywords) -> httpx.Response:
         """
         Peform the authentication loop, with REQUEST and RESPONSE error handling.
@@ -233,8 +277,11 @@ class ThoughtSpot:
             for line in [_ for _ in noti.message.split(".") if _]:
                 logger(line.strip() + ".")
 
+        self._start_keepalive()
+
     def logout(self) -> None:
         """
         Log out of ThoughtSpot.
         """
+        self._stop_keepalive()
         self.api.v1.session_logout()
@@ -204,25 +204,28 @@ class TMLSupportedContent(StrEnum):
         :param subtype: The subtype to convert, e.g. WORKSHEET
         :return: The associated type, e.g. TMLSupportedContent.worksheet
         """
-        mappings = {
-            ("DATA_SOURCE", ""): TMLSupportedContent.connection,
-            ("LOGICAL_TABLE", "ONE_TO_ONE_LOGICAL"): TMLSupportedContent.table,
-            ("LOGICAL_TABLE", "AGGR_WORKSHEET"): TMLSupportedContent.view,
-            ("LOGICAL_TABLE", "SQL_VIEW"): TMLSupportedContent.sqlview,
-            ("LOGICAL_TABLE", "WORKSHEET"): TMLSupportedContent.worksheet,
-            ("LOGICAL_TABLE", "MODEL"): TMLSupportedContent.model,
-            ("PINBOARD_ANSWER_BOOK", ""): TMLSupportedContent.liveboard,
-            ("QUESTION_ANSWER_BOOK", ""): TMLSupportedContent.answer,
-        }
-
-        tml_type = mappings.get((metadata_type, subtype))
+        tml_type = _TYPE_SUBTYPE_TO_TML_TYPE.get((metadata_type, subtype))
         if not tml_type:
             raise errors.CSToolsCLIError(
                 title=f"Unknown type/subtype combination: {metadata_type}/{subtype}",
                 mitigation="Check that the type and subtype are correct.",
             )
 
-        return mappings[(metadata_type, subtype)]
+        return tml_type
+
+
+# Built once at import time; type_subtype_to_tml_type is called per-object on TML
+# export paths, so don't rebuild the lookup table on every call.
+_TYPE_SUBTYPE_TO_TML_TYPE = {
+    ("DATA_SOURCE", ""): TMLSupportedContent.connection,
+    ("LOGICAL_TABLE", "ONE_TO_ONE_LOGICAL"): TMLSupportedContent.table,
+    ("LOGICAL_TABLE", "AGGR_WORKSHEET"): TMLSupportedContent.view,
+    ("LOGICAL_TABLE", "SQL_VIEW"): TMLSupportedContent.sqlview,
+    ("LOGICAL_TABLE", "WORKSHEET"): TMLSupportedContent.worksheet,
+    ("LOGICAL_TABLE", "MODEL"): TMLSupportedContent.model,
+    ("PINBOARD_ANSWER_BOOK", ""): TMLSupportedContent.liveboard,
+    ("QUESTION_ANSWER_BOOK", ""): TMLSupportedContent.answer,
+}
 
 
 class TMLSupportedContentSubtype(StrEnum):
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+import concurrent.futures as cf
 import contextlib
-import json
 import logging
 import os
 import pathlib
@@ -140,13 +140,19 @@ class CSToolsVirtualEnvironment:
 
     def is_package_installed(self, package_name: str, with_system_python: bool = False) -> bool:
         """Check if a package is installed. This should be called only within CS Tools."""
-        cp = self.pip("list", "--format", "json", should_stream_output=False, with_system_python=with_system_python)
+        # `pip list` imports all of pip just to enumerate every distribution; asking
+        # the interpreter for the one distribution's metadata is much cheaper
+        code = (
+            "import importlib.metadata, sys\n"
+            "try:\n"
+            "    importlib.metadata.distribution('{package}')\n"
+            "except importlib.metadata.PackageNotFoundError:\n"
+            "    sys.exit(1)\n"
+        ).format(package=package_name)
 
-        for installed in json.loads(cp.stdout.decode()):
-            if installed["name"] == package_name:
-                return True
-
-        return False
+        python = self.system_python if with_system_python else self.python
+        cp = python("-c", code, should_stream_output=False, raise_on_failure=False)
+        return cp.returncode == 0
 
     def check_if_globally_installed(self, *, remove: bool = False) -> bool:
         """Check if self is installed in global python, which would PATH-shadow the VENV binary."""
@@ -234,13 +240,17 @@ class CSToolsVirtualEnvironment:
         self.log_dir.mkdir(parents=True, exist_ok=True)
         self.tmp_dir.mkdir(parents=True, exist_ok=True)
 
-        # Clean the temporary directory.
-        for path in self.tmp_dir.iterdir():
+        # Clean the temporary directory. Deletes are blocking syscalls which release
+        # the GIL, so fan them out instead of paying for each one serially.
+        def _remove(path: pathlib.Path) -> None:
             try:
                 path.unlink(missing_ok=True) if path.is_file() else shutil.rmtree(path, ignore_errors=True)
             except PermissionError:
                 log.warning(f"{path} appears to be in use and can't be cleaned up.. do you have it open somewhere?")
 
+        with cf.ThreadPoolExecutor(max_workers=4, thread_name_prefix="tmp-clean") as pool:
+            list(pool.map(_remove, self.tmp_dir.iterdir()))
+
     def make(self) -> None:
         """Create the virtual environment."""
         if self.exists:
@@ -263,8 +273,19 @@ class CSToolsVirtualEnvironment:
 
     def reset(self) -> None:
         """Reset the virtual environment to base."""
-        # Destroy the venv.
-        shutil.rmtree(self.venv_path, ignore_errors=True)
+        # Move the venv aside with one atomic rename before deleting -- an interrupted
+        # delete then can't leave a half-removed venv at the live path.
+        if self.venv_path.exists():
+            trash = self.venv_path.with_name(self.venv_path.name + ".deleted")
+            shutil.rmtree(trash, ignore_errors=True)
+
+            try:
+                os.replace(self.venv_path, trash)
+            except OSError:
+                # locked or cross-device; fall back to deleting in place
+                trash = self.venv_path
+
+            shutil.rmtree(trash, ignore_errors=True)
 
         # Re-make the venv.
         self.make()
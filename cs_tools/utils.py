@@ -7,17 +7,30 @@ from base64 import (
 from collections.abc import Generator, Iterable
 from typing import Any, Callable, Optional, TypeVar, Union
 import datetime as dt
+import functools as ft
 import getpass
-import importlib
+import importlib.util
 import io
 import itertools as it
 import json
 import logging
 import os
 import pathlib
+import re
 import site
 import threading
-import zlib
+import zipfile
+
+try:
+    # ISA-L is a SIMD-accelerated, api-compatible implementation of zlib -- use it
+    # when it's available (the deflate container is identical either way)
+    from isal import isal_zlib as zlib
+
+    _ZLIB_FAST_LEVEL = 2  # isal levels run 0 - 3
+except ImportError:
+    import zlib
+
+    _ZLIB_FAST_LEVEL = 6
 
 import rich
 
@@ -25,25 +38,44 @@ T = TypeVar("T")
 log = logging.getLogger(__name__)
 
 
+# python 3.12+ implements batched in C
+_batched_c = getattr(it, "batched", None)
+
+
 def batched(iterable: Iterable[T], *, n: int) -> Generator[Iterable[T], None, None]:
     """Yield successive n-sized chunks from list."""
     # batched('ABCDEFG', 3) --> ABC DEF G
     if n < 1:
         raise ValueError("n must be at least one")
 
+    if _batched_c is not None:
+        yield from _batched_c(iterable, n)
+        return
+
     iterable = iter(iterable)
 
     while batch := tuple(it.islice(iterable, n)):
         yield batch
 
 
+@ft.cache
+def _current_username() -> str:
+    """getpass.getuser hits the passwd database; only pay for it once."""
+    return getpass.getuser()
+
+
+@ft.cache
+def _username_pattern() -> re.Pattern:
+    """Compiled once; pattern.sub beats repeated str.replace on long text."""
+    return re.compile(re.escape(_current_username()))
+
+
 def anonymize(text: str, *, anonymizer: str = " {anonymous} ") -> str:
     """Replace text with an anonymous value."""
-    text = text.replace(getpass.getuser(), anonymizer)
-    return text
+    return _username_pattern().sub(anonymizer.replace("\\", "\\\\"), text)
 
 
-def obscure(data: bytes) -> bytes:
+def obscure(data: Union[bytes, bytearray, memoryview, str]) -> bytes:
     """
     Encode data to obscure its text.
 
@@ -53,9 +85,11 @@ def obscure(data: bytes) -> bytes:
         return
 
     if isinstance(data, str):
-        data = str.encode(data)
+        data = data.encode("utf-8")
 
-    return b64e(zlib.compress(data, level=9))
+    # this is obfuscation, not archival -- the compression ratio doesn't matter, so
+    # don't pay for level 9 (the slowest); the output format is unchanged
+    return b64e(zlib.compress(data, _ZLIB_FAST_LEVEL))
 
 
 def reveal(obscured: bytes) -> bytes:
@@ -69,6 +103,28 @@ def reveal(obscured: bytes) -> bytes:
     return zlib.decompress(b64d(obscured))
 
 
+_ALREADY_COMPRESSED_SUFFIXES = frozenset({".whl", ".zip", ".gz", ".bz2", ".xz", ".zst"})
+
+
+def make_zip_archive(directory: pathlib.Path, zip_fp: pathlib.Path) -> pathlib.Path:
+    """
+    Zip the contents of a directory.
+
+    Wheels and sdists are already DEFLATE-compressed, so they're stored as-is rather
+    than paying zlib to recompress hundreds of megabytes for no size win; everything
+    else gets a fast compression level.
+    """
+    with zipfile.ZipFile(zip_fp, mode="w", compression=zipfile.ZIP_DEFLATED, compresslevel=1) as archive:
+        for path in sorted(directory.rglob("*")):
+            if path.is_dir():
+                continue
+
+            compress_type = zipfile.ZIP_STORED if path.suffix in _ALREADY_COMPRESSED_SUFFIXES else None
+            archive.write(path, arcname=path.relative_to(directory), compress_type=compress_type)
+
+    return zip_fp
+
+
 def find(predicate: Callable[[Any], [bool]], iterable: list[Any]) -> Any:
     """
     Return the first element in the sequence that meets the predicate.
@@ -80,6 +136,9 @@ def find(predicate: Callable[[Any], [bool]], iterable: list[Any]) -> Any:
     return None
 
 
+_MISSING = object()
+
+
 class State:
     """
     An object that can be used to store arbitrary state.
@@ -97,11 +156,15 @@ class State:
         self._state[key] = value
 
     def __getattr__(self, key: Any) -> Any:
-        try:
-            return self._state[key]
-        except KeyError:
+        # hasattr-style probing makes misses common -- .get with a sentinel skips the
+        # exception machinery on both hit and miss
+        value = self._state.get(key, _MISSING)
+
+        if value is _MISSING:
             cls_name = self.__class__.__name__
-            raise AttributeError(f"'{cls_name}' object has no attribute '{key}'") from None
+            raise AttributeError(f"'{cls_name}' object has no attribute '{key}'")
+
+        return value
 
     def __delattr__(self, key: Any) -> None:
         del self._state[key]
@@ -186,21 +249,21 @@ class ExceptedThread(threading.Thread):
             log.debug(f"Something went wrong in {self}", exc_info=True)
 
 
+@ft.cache
 def determine_editable_install() -> bool:
     """Determine if the current CS Tools context is an editable install."""
+    # scanning site-packages isn't free, and the answer can't change mid-process
     if "FAKE_EDITABLE" in os.environ:
         return True
 
     for directory in site.getsitepackages():
         try:
-            site_directory = pathlib.Path(directory)
-
-            for path in site_directory.iterdir():
-                if not path.is_file():
-                    continue
-
-                if "__editable__.cs_tools" in path.as_posix():
-                    return True
+            # scandir's DirEntry caches file-type info from the directory read itself,
+            # so this is one syscall per directory instead of one stat per entry
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if "__editable__.cs_tools" in entry.name and entry.is_file():
+                        return True
 
         # not all distros will bundle python the same (eg. ubuntu-slim)
         except FileNotFoundError:
@@ -209,17 +272,20 @@ def determine_editable_install() -> bool:
     return False
 
 
+@ft.cache
 def get_package_directory(package_name: str) -> Optional[pathlib.Path]:
     """Get the path to the package directory."""
-    # TODO: Consider using __spec__.parent instead of module.__file__
-    #       https://docs.python.org/3/reference/import.html#package__
+    # find_spec resolves the location without executing the module's top-level code
     try:
-        module = importlib.import_module(package_name)
-        assert module.__file__ is not None
-        return pathlib.Path(module.__file__).parent
+        spec = importlib.util.find_spec(package_name)
     except ModuleNotFoundError:
         return None
 
+    if spec is None or spec.origin is None:
+        return None
+
+    return pathlib.Path(spec.origin).parent
+
 
 def permission_mask_info(file: pathlib.Path) -> str:
     """